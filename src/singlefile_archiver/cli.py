@@ -12,7 +12,7 @@ from rich.table import Table
 
 from . import __version__
 from .core import archive, docker, monitor, retry, test
-from .services.writer import StateWriter
+from .services.writer import STATE_FILE_NAME, StateWriter
 from .utils.config import get_config
 from .utils.paths import get_project_dir
 
@@ -43,7 +43,7 @@ def info() -> None:
     table.add_row("Version", __version__)
     table.add_row("Project Directory", str(project_dir))
     table.add_row("Config File", str(project_dir / "config.json"))
-    table.add_row("State File", str(project_dir / "state.json"))
+    table.add_row("State File", str(project_dir / STATE_FILE_NAME))
     
     console.print(table)
 
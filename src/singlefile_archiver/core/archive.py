@@ -2,6 +2,7 @@
 
 import csv
 import json
+import os
 import re
 import subprocess
 import tempfile
@@ -16,34 +17,71 @@ from rich.console import Console
 from rich.progress import Progress, TaskID
 
 from ..services.cookie_fetcher import CookieProvider
-from ..services.csv_processor import CSVProcessor
-from ..services.docker_service import DockerService
+from ..services.csv_processor import CSVProcessor, normalize_url
+from ..services.docker_service import DockerService, saved_page_url
 from ..utils.config import get_config
 from ..utils.logging import get_logger
+from ..utils.paths import encode_url_for_filename
 
 app = typer.Typer()
 console = Console()
 logger = get_logger(__name__)
 
 
+# Source URL of each archived page (normalized, None when the page has no
+# SingleFile header or can't be read), keyed by archive directory and file
+# name and tagged with the file's (mtime_ns, size) so rewritten files are re-read
+_ARCHIVE_INDEX: Dict[Path, Dict[str, Tuple[Tuple[int, int], Optional[str]]]] = {}
+
+
+def _archived_urls(archive_dir: Path) -> Dict[str, Tuple[Tuple[int, int], Optional[str]]]:
+    """Return the cached source URLs of archived HTML files, reading only new or changed ones"""
+    index = _ARCHIVE_INDEX.setdefault(archive_dir, {})
+    current = set()
+    
+    with os.scandir(archive_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.') or not name.endswith('.html'):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            current.add(name)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = index.get(name)
+            if cached is not None and cached[0] == signature:
+                continue
+            saved_url = None
+            try:
+                with open(entry.path, 'rb') as f:
+                    # SingleFile stamps the source URL in a comment at the top of the page
+                    saved_url = saved_page_url(f.read(10240))
+            except OSError:
+                # Remembered as unreadable until the file changes
+                pass
+            index[name] = (signature, normalize_url(saved_url) if saved_url else None)
+    
+    # Forget pages that were moved or deleted since the last scan
+    for name in index.keys() - current:
+        del index[name]
+    
+    return index
+
+
 def check_duplicate_url(url: str, archive_dir: Path) -> bool:
-    """Check if a URL has already been archived by searching for it in existing files"""
+    """Check if a URL has already been archived by comparing it with the saved pages' source URLs"""
     if not archive_dir.exists():
         return False
     
     try:
-        # Search for the URL in all HTML files
-        for html_file in archive_dir.glob("*.html"):
-            try:
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    # Read first 10KB to look for the URL in meta tags or comments
-                    content = f.read(10240)
-                    if url in content:
-                        logger.info(f"📋 URL already archived in: {html_file.name}")
-                        return True
-            except Exception:
-                # Skip files that can't be read
-                continue
+        # Each file is read once per process, and again only if it changes
+        wanted = normalize_url(url)
+        for name, (_, saved_url) in _archived_urls(archive_dir).items():
+            if saved_url == wanted:
+                logger.info(f"📋 URL already archived in: {name}")
+                return True
                 
         return False
         
@@ -54,13 +92,7 @@ def check_duplicate_url(url: str, archive_dir: Path) -> bool:
 
 def get_page_title_filename(url: str, container_name: str) -> str:
     """Get page title and create filename, fallback to URL-based name if needed"""
-    def _encode_url_for_filename(raw: str, max_len: int = 180) -> str:
-        encoded = urllib.parse.quote(raw, safe="")
-        if len(encoded) > max_len:
-            return encoded[: max_len - 1] + "…"
-        return encoded
-
-    url_part = _encode_url_for_filename(url)
+    url_part = encode_url_for_filename(url)
     try:
         # Use SingleFile to get page info without saving
         cmd = [
@@ -277,18 +309,25 @@ def archive_urls(
             batch = urls[i:i + batch_size]
             console.print(f"🔄 Processing batch {i//batch_size + 1} ({len(batch)} URLs)")
             
+            # One SingleFile container archives the whole batch
+            try:
+                results = docker_service.archive_urls(
+                    batch, output_path, cookies_file=cookies_file, batch_size=batch_size
+                )
+            except Exception as e:
+                logger.error(f"Error archiving batch: {e}")
+                results = {}
+            
             for url in batch:
-                try:
-                    result = docker_service.archive_url(url, output_path, cookies_file=cookies_file)
-                    if not result.success:
-                        failed_urls.append(url)
-                        console.print(f"❌ Failed to archive: {url}")
-                    else:
-                        console.print(f"✅ Archived: {url}")
-                except Exception as e:
-                    logger.error(f"Error archiving {url}: {e}")
+                result = results.get(url)
+                if result is None:
                     failed_urls.append(url)
                     console.print(f"❌ Error archiving: {url}")
+                elif not result.success:
+                    failed_urls.append(url)
+                    console.print(f"❌ Failed to archive: {url}")
+                else:
+                    console.print(f"✅ Archived: {url}")
                 
                 progress.advance(task)
     
@@ -46,7 +46,9 @@ def docker_status() -> None:
 
 
 @app.command("pull")
-def pull_singlefile_image() -> None:
+def pull_singlefile_image(
+    force: bool = typer.Option(False, "--force", help="Pull even if the image is already present"),
+) -> None:
     """Pull the SingleFile Docker image."""
     docker_service = DockerService()
     
@@ -57,9 +59,9 @@ def pull_singlefile_image() -> None:
     console.print("📥 Pulling SingleFile Docker image...")
     
     try:
-        result = docker_service.pull_image()
+        result = docker_service.pull_image(force=force)
         if result.success:
-            console.print("✅ Successfully pulled SingleFile image")
+            console.print(f"✅ {result.message}")
         else:
             console.print(f"❌ Failed to pull image: {result.error}")
             raise typer.Exit(1)
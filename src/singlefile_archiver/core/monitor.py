@@ -1,5 +1,6 @@
 """File monitoring functionality."""
 
+import signal
 import time
 from pathlib import Path
 from typing import Optional
@@ -48,6 +49,10 @@ def start_monitoring(
         check_interval=interval
     )
     
+    # `docker stop` sends SIGTERM; treat it like Ctrl+C so the monitor shuts
+    # down normally and buffered log records are flushed on exit
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
     try:
         monitor.start_monitoring(use_watchdog=True)
     except KeyboardInterrupt:
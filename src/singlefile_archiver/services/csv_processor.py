@@ -1,14 +1,51 @@
 """CSV file processing service."""
 
 import csv
+import re
 from pathlib import Path
-from typing import List
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Pattern
+from urllib.parse import urlparse, urlsplit, urlunsplit
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+
+def normalize_url(url: str) -> str:
+    """Return a canonical form of a URL for duplicate detection.
+
+    Lowercases the scheme and host, drops default ports and fragments,
+    sorts query parameters and removes a bare trailing ``/`` path.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    userinfo, at, hostport = parts.netloc.rpartition("@")
+    hostport = hostport.lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port and hostport.endswith(default_port):
+        hostport = hostport[: -len(default_port)]
+
+    path = "" if parts.path == "/" else parts.path
+    query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+
+    return urlunsplit((scheme, f"{userinfo}{at}{hostport}", path, query, ""))
+
+
+def _compile_domain_matcher(allowed_domains: List[str]) -> Optional[Pattern[str]]:
+    """Build one alternation matching any allowed domain as a substring."""
+    needles = {domain.lower() for domain in allowed_domains}
+    if not needles:
+        return None
+    # Longest first so the alternation prefers the most specific domain
+    ordered = sorted(needles, key=len, reverse=True)
+    return re.compile("|".join(re.escape(needle) for needle in ordered))
+
 
 class CSVProcessor:
     """Service for processing CSV files containing URLs."""
@@ -30,7 +67,7 @@ class CSVProcessor:
         urls = []
         
         if not csv_file.exists():
-            logger.error(f"CSV file not found: {csv_file}")
+            logger.error("CSV file not found: %s", csv_file)
             return urls
         
         try:
@@ -41,11 +78,11 @@ class CSVProcessor:
                     if url and url.startswith(('http://', 'https://')):
                         urls.append(url)
             
-            logger.info(f"Found {len(urls)} URLs in {csv_file}")
+            logger.info("Found %d URLs in %s", len(urls), csv_file)
             return urls
         
         except Exception as e:
-            logger.error(f"Error reading CSV file {csv_file}: {e}")
+            logger.error("Error reading CSV file %s: %s", csv_file, e)
             return []
     
     def save_urls(self, urls: List[str], csv_file: Path) -> bool:
@@ -65,39 +102,40 @@ class CSVProcessor:
                     if url and self.is_valid_url(url):
                         writer.writerow([url])
                     else:
-                        logger.warning(f"Skipping invalid URL: {url}")
+                        logger.warning("Skipping invalid URL: %s", url)
             
-            logger.info(f"Saved {len(urls)} URLs to {csv_file}")
+            logger.info("Saved %d URLs to %s", len(urls), csv_file)
             return True
         
         except Exception as e:
-            logger.error(f"Error writing CSV file {csv_file}: {e}")
+            logger.error("Error writing CSV file %s: %s", csv_file, e)
             return False
     
     def merge_csv_files(self, input_files: List[Path], output_file: Path) -> bool:
         """Merge multiple CSV files into one."""
-        all_urls = []
+        total_urls = 0
         
+        # Remove duplicates while preserving order, one file at a time.
+        # setdefault hashes each key once and keeps the first spelling.
+        unique_urls: Dict[str, str] = {}
+        keep_first = unique_urls.setdefault
         for csv_file in input_files:
             urls = self.load_urls(csv_file)
-            all_urls.extend(urls)
+            total_urls += len(urls)
+            for url in urls:
+                keep_first(normalize_url(url), url)
         
-        # Remove duplicates while preserving order
-        unique_urls = []
-        seen = set()
-        for url in all_urls:
-            if url not in seen:
-                unique_urls.append(url)
-                seen.add(url)
-        
-        logger.info(f"Merged {len(all_urls)} URLs into {len(unique_urls)} unique URLs")
-        return self.save_urls(unique_urls, output_file)
+        logger.info("Merged %d URLs into %d unique URLs", total_urls, len(unique_urls))
+        return self.save_urls(list(unique_urls.values()), output_file)
     
     def filter_urls_by_domain(self, csv_file: Path, allowed_domains: List[str], output_file: Path) -> bool:
         """Filter URLs by allowed domains."""
         urls = self.load_urls(csv_file)
         filtered_urls = []
         
+        # Match all allowed domains in a single scan per netloc
+        domain_matcher = _compile_domain_matcher(allowed_domains)
+        
         for url in urls:
             try:
                 parsed = urlparse(url)
@@ -107,12 +145,12 @@ class CSVProcessor:
                 if domain.startswith('www.'):
                     domain = domain[4:]
                 
-                if any(allowed_domain.lower() in domain for allowed_domain in allowed_domains):
+                if domain_matcher is not None and domain_matcher.search(domain):
                     filtered_urls.append(url)
             except Exception as e:
-                logger.warning(f"Error filtering URL {url}: {e}")
+                logger.warning("Error filtering URL %s: %s", url, e)
         
-        logger.info(f"Filtered {len(urls)} URLs to {len(filtered_urls)} URLs matching domains")
+        logger.info("Filtered %d URLs to %d URLs matching domains", len(urls), len(filtered_urls))
         return self.save_urls(filtered_urls, output_file)
     
     def validate_csv(self, csv_file: Path) -> dict:
@@ -1,23 +1,124 @@
 """Docker service for SingleFile container management."""
 
+import atexit
+import logging
+import os
 import re
+import secrets
+import stat
 import subprocess
-from datetime import datetime
+import tempfile
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse, quote
+from typing import IO, TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, Type
+from urllib.parse import urlparse
 
-import docker
-from docker.errors import DockerException
 from html import unescape
 
 from ..utils.config import get_config
 from ..utils.logging import get_logger
-from ..utils.paths import safe_filename
+from ..utils.paths import collision_suffix, encode_url_for_filename, safe_filename
+from .csv_processor import normalize_url
+
+if TYPE_CHECKING:
+    import docker
 
 logger = get_logger(__name__)
 
+# SingleFile emits <title> near the top of the document, so only the
+# first 64 KiB of the page is searched for it
+_TITLE_SCAN_BYTES = 64 * 1024
+
+# Read size used when streaming archived pages to disk
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Bounded so a missing </title> cannot drag the scan across the whole page
+_TITLE_MAX_BYTES = 4096
+
+# NamedTemporaryFile always creates 0600 files; archives get the mode a
+# plain open() would give them under the process umask
+_ARCHIVE_FILE_MODE: Optional[int] = None
+_ARCHIVE_FILE_MODE_LOCK = threading.Lock()
+
+# Header comment SingleFile writes at the top of every saved page
+_SAVED_URL_RE = re.compile(rb"Page saved with SingleFile\s+url:\s*(\S+)")
+
+# Where a batch's URL list and output directory are mounted in the container
+_BATCH_MOUNT_PATH = "/singlefile-batch"
+
+# One lock per image so concurrent pulls of the same tag share a single
+# registry round trip; callers that waited get the in-flight pull's result
+_PULL_LOCKS: Dict[str, threading.Lock] = {}
+_PULL_RESULTS: Dict[str, "ArchiveResult"] = {}
+_PULL_MASTER = threading.Lock()
+
+
+def saved_page_url(head: bytes) -> Optional[str]:
+    """Return the source URL from the header SingleFile writes into a saved page."""
+    match = _SAVED_URL_RE.search(head)
+    if match is None:
+        return None
+    return match.group(1).decode("utf-8", errors="replace")
+
+
+def _read_umask() -> int:
+    """Return the process umask, without changing it where the kernel reports it."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # os.umask() can only be read by setting it, so restore it straight away
+    umask = os.umask(0o077)
+    os.umask(umask)
+    return umask
+
+
+def _archive_file_mode() -> int:
+    """Return the mode a plain open() would give a new archive file."""
+    global _ARCHIVE_FILE_MODE
+    with _ARCHIVE_FILE_MODE_LOCK:
+        if _ARCHIVE_FILE_MODE is None:
+            _ARCHIVE_FILE_MODE = 0o666 & ~_read_umask()
+        return _ARCHIVE_FILE_MODE
+
+
+def _find_tag(window: bytes, tag: bytes, start: int = 0, end: Optional[int] = None) -> int:
+    """Return the offset of ``tag`` in lowercased ``window`` where it ends at a tag-name boundary."""
+    if end is None:
+        end = len(window)
+    while True:
+        pos = window.find(tag, start, end)
+        if pos == -1:
+            return -1
+        after = window[pos + len(tag):pos + len(tag) + 1]
+        if after in (b">", b"/") or after.isspace():
+            return pos
+        start = pos + 1
+
+
+def _extract_title(head: bytes) -> Optional[str]:
+    """Return the text of the first ``<title>`` element in ``head``, if any."""
+    # bytes.lower() only folds ASCII, so offsets in the window match head
+    window = head[:_TITLE_SCAN_BYTES].lower()
+    open_tag = _find_tag(window, b"<title")
+    if open_tag == -1:
+        return None
+    start = window.find(b">", open_tag) + 1
+    if start == 0:
+        return None
+    end = _find_tag(window, b"</title", start, start + _TITLE_MAX_BYTES + len(b"</title>"))
+    if end == -1:
+        return None
+
+    # Decode only the title slice, not the whole document. Whitespace runs
+    # are left alone: safe_filename() turns each run into a single "_"
+    return unescape(head[start:end].decode("utf-8", errors="replace")).strip() or None
+
 
 @dataclass
 class ArchiveResult:
@@ -34,16 +135,36 @@ class DockerService:
     def __init__(self):
         """Initialize Docker service."""
         self.config = get_config()
-        self._client: Optional[docker.DockerClient] = None
+        self._client: Optional["docker.DockerClient"] = None
+        # SDK error types, filled in when the SDK is loaded; until then no SDK
+        # call has run, and an empty tuple in an except clause catches nothing
+        self._docker_errors: Tuple[Type[Exception], ...] = ()
+        # Long-lived container used when docker_persistent is enabled
+        self._container = None
+        self._exec_prefix: List[str] = []
+        self._persistent_volumes: Dict[str, Dict[str, str]] = {}
+        # Per-call pieces that only depend on the config, resolved once
+        self._docker_cmd_base: Tuple[str, ...] = ("docker", "run", "--rm")
+        self._config_cookies_file: Optional[Path] = (
+            Path(self.config.docker_cookies_file).expanduser()
+            if self.config.docker_cookies_file
+            else None
+        )
     
     @property
-    def client(self) -> docker.DockerClient:
+    def client(self) -> "docker.DockerClient":
         """Get Docker client, creating if necessary."""
         if self._client is None:
+            # The SDK pulls in requests/urllib3, which commands that never
+            # talk to Docker shouldn't pay for, so it is imported on first use
+            import docker
+            from docker.errors import DockerException
+            
+            self._docker_errors = (DockerException,)
             try:
                 self._client = docker.from_env()
             except DockerException as e:
-                logger.error(f"Failed to create Docker client: {e}")
+                logger.error("Failed to create Docker client: %s", e)
                 raise
         return self._client
     
@@ -52,19 +173,53 @@ class DockerService:
         try:
             self.client.ping()
             return True
-        except DockerException:
+        except self._docker_errors:
             return False
     
-    def pull_image(self) -> ArchiveResult:
-        """Pull the SingleFile Docker image."""
+    def pull_image(self, force: bool = False) -> ArchiveResult:
+        """Pull the SingleFile Docker image unless it is already present."""
+        image = self.config.docker_image
+        with _PULL_MASTER:
+            lock = _PULL_LOCKS.setdefault(image, threading.Lock())
+        
+        if not lock.acquire(blocking=False):
+            # Another thread is pulling this image right now
+            with lock:
+                result = _PULL_RESULTS.get(image)
+            if result is not None:
+                return result
+            lock.acquire()
+        
+        try:
+            _PULL_RESULTS.pop(image, None)
+            result = None if force else self._local_image(image)
+            if result is None:
+                result = self._pull(image)
+            _PULL_RESULTS[image] = result
+            return result
+        finally:
+            lock.release()
+    
+    def _local_image(self, image: str) -> Optional[ArchiveResult]:
+        """Return a result for an image that is already available locally."""
+        try:
+            self.client.images.get(image)
+        except self._docker_errors:
+            # ImageNotFound, or let the pull surface the real error
+            return None
+        logger.info("Docker image already present: %s", image)
+        return ArchiveResult(success=True, message=f"{image} is already present")
+    
+    def _pull(self, image: str) -> ArchiveResult:
+        """Pull an image from the registry."""
         try:
-            logger.info(f"Pulling Docker image: {self.config.docker_image}")
-            self.client.images.pull(self.config.docker_image)
+            logger.info("Pulling Docker image: %s", image)
+            self.client.images.pull(image)
             return ArchiveResult(
                 success=True,
-                message=f"Successfully pulled {self.config.docker_image}"
+                message=f"Successfully pulled {image}"
             )
-        except DockerException as e:
+        except self._docker_errors as e:
             error_msg = f"Failed to pull image: {e}"
             logger.error(error_msg)
             return ArchiveResult(success=False, error=error_msg)
@@ -80,9 +235,50 @@ class DockerService:
                     "tags": images[0].tags
                 }
             return None
-        except DockerException:
+        except self._docker_errors:
             return None
     
+    def start_persistent(self) -> None:
+        """Start a long-lived SingleFile container that URLs are exec'd into.
+
+        The image entrypoint is replaced with an idle process and recorded,
+        so each ``exec`` runs exactly what ``docker run <image> <args>``
+        would have run, without paying container start-up per URL.
+        """
+        if self._container is not None:
+            return
+
+        volumes: Dict[str, Dict[str, str]] = {}
+        cookies_path = self._config_cookies_file
+        if cookies_path is not None:
+            if cookies_path.exists():
+                volumes[str(cookies_path)] = {
+                    "bind": self.config.docker_cookies_mount_path,
+                    "mode": "ro",
+                }
+
+        container = self.client.containers.run(
+            self.config.docker_image,
+            entrypoint=["tail", "-f", "/dev/null"],
+            volumes=volumes,
+            detach=True,
+            auto_remove=True,
+        )
+        self._exec_prefix = list(container.image.attrs["Config"].get("Entrypoint") or [])
+        self._persistent_volumes = volumes
+        self._container = container
+        atexit.register(self.stop_persistent)
+        logger.info("Started persistent SingleFile container %s", container.short_id)
+
+    def stop_persistent(self) -> None:
+        """Stop the long-lived SingleFile container, if one is running."""
+        container, self._container = self._container, None
+        if container is None:
+            return
+        atexit.unregister(self.stop_persistent)
+        self._kill_container(container)
+        logger.info("Stopped persistent SingleFile container %s", container.short_id)
+    
     def archive_url(
         self,
         url: str,
@@ -90,88 +286,42 @@ class DockerService:
         cookies_file: Optional[Path] = None,
     ) -> ArchiveResult:
         """Archive a single URL using SingleFile."""
+        return self._archive_single(url, output_dir, cookies_file, None)
+
+    def _archive_single(
+        self,
+        url: str,
+        output_dir: Path,
+        cookies_file: Optional[Path],
+        existing: Optional[Set[str]],
+    ) -> ArchiveResult:
+        """Archive one URL; ``existing`` is the known file names in ``output_dir``."""
+        tmp_path: Optional[Path] = None
         try:
             # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Resolve cookies file if provided via argument or configuration
-            container_cookies_path = self.config.docker_cookies_mount_path
-            resolved_cookies: Optional[Path] = None
-
-            candidate = cookies_file
-            if candidate is None and self.config.docker_cookies_file:
-                candidate = Path(self.config.docker_cookies_file)
-
-            if candidate is not None:
-                candidate_path = Path(candidate).expanduser()
-                if candidate_path.exists():
-                    resolved_cookies = candidate_path
-                    logger.debug("Using cookies file: %s", candidate_path)
-                else:
-                    logger.warning("Cookies file not found, skipping: %s", candidate_path)
-
-            # Docker run command
-            docker_cmd = ["docker", "run", "--rm"]
-
-            if resolved_cookies:
-                docker_cmd.extend([
-                    "-v",
-                    f"{resolved_cookies}:{container_cookies_path}:ro",
-                ])
-
-            docker_cmd.append(self.config.docker_image)
-
-            if resolved_cookies:
-                docker_cmd.extend([
-                    "--browser-cookies-file",
-                    container_cookies_path,
-                ])
-
-            docker_cmd.append(url)
-            
-            logger.info(f"Running Docker command: {' '.join(docker_cmd)}")
+            # SingleFile arguments plus the optional read-only cookies mount
+            volumes, singlefile_args = self._cookies_mount(cookies_file)
+            singlefile_args.append(url)
             
-            # Run container
-            result = subprocess.run(
-                docker_cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.docker_timeout
-            )
+            # Stream the page straight into a temp file next to its final
+            # location; it is renamed once the title is known
+            with tempfile.NamedTemporaryFile(
+                dir=output_dir,
+                prefix=".singlefile-",
+                suffix=".part",
+                delete=False,
+            ) as tmp_file:
+                tmp_path = Path(tmp_file.name)
+                # os.replace() keeps the temp file's mode on the final archive
+                os.chmod(tmp_path, _archive_file_mode())
+                returncode, head, stderr = self._run_singlefile(singlefile_args, volumes, tmp_file)
             
-            if result.returncode == 0:
-                output_file: Optional[Path] = None
-
-                if result.stdout:
-                    output_file = self._derive_output_file(url, result.stdout, output_dir)
-                    try:
-                        output_file.write_text(result.stdout, encoding="utf-8")
-                        logger.info("Wrote archive content from stdout to %s", output_file)
-                        return ArchiveResult(
-                            success=True,
-                            output_file=output_file,
-                            message=f"Archived via stdout to {output_file}"
-                        )
-                    except OSError as exc:
-                        error_msg = f"Failed to save stdout content to {output_file}: {exc}"
-                        logger.error(error_msg)
-                        return ArchiveResult(success=False, error=error_msg)
-
-                if not output_file:
-                    output_file = self._derive_output_file(url, "", output_dir)
-
-                if output_file and output_file.exists():
-                    return ArchiveResult(
-                        success=True,
-                        output_file=output_file,
-                        message=f"Successfully archived to {output_file}"
-                    )
-
-                error_msg = f"Archive command succeeded but produced no output for {url}"
-                logger.error(error_msg)
-                return ArchiveResult(success=False, error=error_msg)
+            if returncode == 0:
+                return self._store_archive(url, tmp_path, head, output_dir, existing)
             else:
-                error_msg = f"Docker command failed: {result.stderr}"
+                error_msg = f"Docker command failed: {stderr.decode('utf-8', errors='replace')}"
                 logger.error(error_msg)
                 return ArchiveResult(success=False, error=error_msg)
         
@@ -184,17 +334,421 @@ class DockerService:
             error_msg = f"Archive operation failed: {e}"
             logger.error(error_msg)
             return ArchiveResult(success=False, error=error_msg)
+        
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def archive_urls(
+        self,
+        urls: List[str],
+        output_dir: Path,
+        cookies_file: Optional[Path] = None,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, ArchiveResult]:
+        """Archive several URLs, running one SingleFile container per batch.
+
+        URLs are grouped by ``batch_size`` (default ``archive_batch_size``).
+        SingleFile reads each batch from a mounted URL list and saves one page
+        per URL; pages are matched back to their URL through the comment
+        SingleFile stamps at the top of every saved page.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        size = max(1, batch_size or self.config.archive_batch_size)
+
+        # List the output directory once; names are added as archives land,
+        # so naming collisions are resolved without a stat per page
+        with os.scandir(output_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_file()}
+
+        results: Dict[str, ArchiveResult] = {}
+        for start in range(0, len(urls), size):
+            batch = urls[start:start + size]
+            results.update(self._archive_batch(batch, output_dir, cookies_file, existing))
+        return results
+
+    def _archive_batch(
+        self,
+        urls: List[str],
+        output_dir: Path,
+        cookies_file: Optional[Path],
+        existing: Set[str],
+    ) -> Dict[str, ArchiveResult]:
+        """Archive one batch of URLs with a single SingleFile invocation."""
+        # URLs that normalize alike are the same page: archive it once and
+        # give every spelling of it the same result
+        groups: Dict[str, List[str]] = {}
+        for url in urls:
+            groups.setdefault(normalize_url(url), []).append(url)
+        
+        if len(groups) == 1:
+            return self._archive_each(groups, output_dir, cookies_file, existing)
+
+        try:
+            with tempfile.TemporaryDirectory(dir=output_dir, prefix=".singlefile-batch-") as work:
+                work_dir = Path(work)
+                # The container user is unknown, so the pages directory has to
+                # be writable by anyone; an unguessable name under a directory
+                # that cannot be listed keeps other local users out of it
+                pages_dir = work_dir / f"pages-{secrets.token_hex(16)}"
+                pages_dir.mkdir()
+                urls_file = work_dir / "urls.txt"
+                urls_file.write_text(
+                    "\n".join(group[0] for group in groups.values()) + "\n", encoding="utf-8"
+                )
+                # The container may not run as the host user: it must be able
+                # to enter the mount, read the URL list and write pages
+                work_dir.chmod(0o711)
+                urls_file.chmod(0o644)
+                pages_dir.chmod(0o777)
+
+                volumes, singlefile_args = self._cookies_mount(cookies_file)
+                volumes[str(work_dir)] = {"bind": _BATCH_MOUNT_PATH, "mode": "rw"}
+                singlefile_args.extend([
+                    "--urls-file", f"{_BATCH_MOUNT_PATH}/urls.txt",
+                    "--output-directory", f"{_BATCH_MOUNT_PATH}/{pages_dir.name}",
+                    "--dump-content=false",
+                ])
+
+                # One container archives every page, so allow each its own budget
+                timeout = self.config.docker_timeout * len(groups)
+                with open(os.devnull, "wb") as sink:
+                    returncode, _, stderr = self._run_singlefile(
+                        singlefile_args, volumes, sink, timeout=timeout
+                    )
+                results = self._collect_batch(groups, pages_dir, output_dir, existing)
+
+        except Exception as e:
+            logger.warning("Batch archive failed (%s), archiving URLs one by one", e)
+            return self._archive_each(groups, output_dir, cookies_file, existing)
+
+        if returncode != 0 and not any(result.success for result in results.values()):
+            logger.warning(
+                "Batch archive failed (%s), archiving URLs one by one",
+                stderr.decode("utf-8", errors="replace").strip(),
+            )
+            return self._archive_each(groups, output_dir, cookies_file, existing)
+
+        return results
+
+    def _archive_each(
+        self,
+        groups: Dict[str, List[str]],
+        output_dir: Path,
+        cookies_file: Optional[Path],
+        existing: Set[str],
+    ) -> Dict[str, ArchiveResult]:
+        """Archive each group's first URL on its own and share the result within the group."""
+        results: Dict[str, ArchiveResult] = {}
+        for group in groups.values():
+            result = self._archive_single(group[0], output_dir, cookies_file, existing)
+            results.update(dict.fromkeys(group, result))
+        return results
+
+    def _collect_batch(
+        self,
+        groups: Dict[str, List[str]],
+        pages_dir: Path,
+        output_dir: Path,
+        existing: Set[str],
+    ) -> Dict[str, ArchiveResult]:
+        """Move each page saved for a batch to its title-based name.
+
+        ``groups`` maps each normalized URL to the requested URLs behind it;
+        every URL in a group gets the result of its page.
+        """
+        pending = dict(groups)
+        unmatched: List[Tuple[Path, bytes]] = []
+        results: Dict[str, ArchiveResult] = {}
+
+        for page in sorted(pages_dir.iterdir()):
+            # Only regular files carrying SingleFile's header are pages it saved
+            if not stat.S_ISREG(page.lstat().st_mode):
+                logger.warning("Ignoring non-file entry %s in batch output", page.name)
+                continue
+            with open(page, "rb") as fh:
+                head = fh.read(_TITLE_SCAN_BYTES)
+            saved_url = saved_page_url(head)
+            if saved_url is None:
+                logger.warning("Ignoring batch file %s without a SingleFile header", page.name)
+                continue
+            group = pending.pop(normalize_url(saved_url), None)
+            if group is None:
+                unmatched.append((page, head))
+                continue
+            result = self._store_archive(group[0], page, head, output_dir, existing)
+            results.update(dict.fromkeys(group, result))
+
+        # A single leftover page and URL belong together (e.g. after a redirect)
+        if len(unmatched) == 1 and len(pending) == 1:
+            page, head = unmatched.pop()
+            _, group = pending.popitem()
+            result = self._store_archive(group[0], page, head, output_dir, existing)
+            results.update(dict.fromkeys(group, result))
+
+        for page, _ in unmatched:
+            logger.warning("Could not match batch page %s to a requested URL", page.name)
+
+        for group in pending.values():
+            error_msg = f"Batch archive produced no output for {group[0]}"
+            logger.error(error_msg)
+            results.update(dict.fromkeys(group, ArchiveResult(success=False, error=error_msg)))
+
+        return results
+
+    def _cookies_mount(self, cookies_file: Optional[Path]) -> Tuple[Dict[str, Dict[str, str]], List[str]]:
+        """Resolve the cookies file into a read-only mount and SingleFile flags."""
+        container_cookies_path = self.config.docker_cookies_mount_path
+        volumes: Dict[str, Dict[str, str]] = {}
+        singlefile_args: List[str] = []
+
+        # Resolve cookies file if provided via argument or configuration
+        if cookies_file is not None:
+            candidate_path: Optional[Path] = Path(cookies_file).expanduser()
+        else:
+            candidate_path = self._config_cookies_file
+
+        if candidate_path is not None:
+            if candidate_path.exists():
+                logger.debug("Using cookies file: %s", candidate_path)
+                volumes[str(candidate_path)] = {"bind": container_cookies_path, "mode": "ro"}
+                singlefile_args.extend([
+                    "--browser-cookies-file",
+                    container_cookies_path,
+                ])
+            else:
+                logger.warning("Cookies file not found, skipping: %s", candidate_path)
+
+        return volumes, singlefile_args
+
+    def _run_singlefile(
+        self,
+        singlefile_args: List[str],
+        volumes: Dict[str, Dict[str, str]],
+        destination: IO[bytes],
+        timeout: Optional[float] = None,
+    ) -> Tuple[int, bytes, bytes]:
+        """Run SingleFile via the Docker SDK, falling back to the ``docker`` CLI.
+
+        ``timeout`` defaults to ``docker_timeout``.
+        """
+        if timeout is None:
+            timeout = self.config.docker_timeout
+        try:
+            client = self.client
+        except self._docker_errors:
+            logger.warning("Docker SDK unavailable, falling back to the docker CLI")
+            docker_cmd = list(self._docker_cmd_base)
+            for host_path, mount in volumes.items():
+                docker_cmd.extend(["-v", f"{host_path}:{mount['bind']}:{mount['mode']}"])
+            docker_cmd.append(self.config.docker_image)
+            docker_cmd.extend(singlefile_args)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running Docker command: %s", " ".join(docker_cmd))
+            return self._run_streaming(docker_cmd, destination, timeout)
+
+        if self.config.docker_persistent:
+            self.start_persistent()
+            # Per-call mounts can't be added to a running container
+            if volumes.items() <= self._persistent_volumes.items():
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Running in persistent container: %s", " ".join(singlefile_args))
+                return self._exec_persistent(client, singlefile_args, destination, timeout)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Running container: %s %s", self.config.docker_image, " ".join(singlefile_args)
+            )
+        return self._run_container(client, singlefile_args, volumes, destination, timeout)
+
+    def _exec_persistent(
+        self,
+        client: "docker.DockerClient",
+        singlefile_args: List[str],
+        destination: IO[bytes],
+        timeout: float,
+    ) -> Tuple[int, bytes, bytes]:
+        """Run SingleFile inside the persistent container via ``exec``.
+
+        Returns the same ``(exit code, head, stderr)`` triple as
+        :meth:`_run_streaming`.
+        """
+        deadline = time.monotonic() + timeout
+
+        exec_id = client.api.exec_create(
+            self._container.id,
+            self._exec_prefix + singlefile_args,
+            stdout=True,
+            stderr=True,
+        )["Id"]
+        stderr_parts: List[bytes] = []
+
+        def stdout_chunks() -> Iterable[bytes]:
+            for out, err in client.api.exec_start(exec_id, stream=True, demux=True):
+                if err:
+                    stderr_parts.append(err)
+                if out:
+                    yield out
+
+        # An exec can't be killed on its own; on timeout the whole container
+        # is stopped and restarted lazily by the next call
+        timer = threading.Timer(timeout, self.stop_persistent)
+        timer.start()
+        try:
+            head = self._copy_stream(stdout_chunks(), destination)
+        finally:
+            timer.cancel()
 
-    def _derive_output_file(self, url: str, html_content: str, output_dir: Path) -> Path:
-        """Generate a readable output filename based on page title."""
-        title: Optional[str] = None
+        if time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(singlefile_args, timeout)
 
-        if html_content:
-            match = re.search(r"<title>(.*?)</title>", html_content, re.IGNORECASE | re.DOTALL)
-            if match:
-                extracted = unescape(match.group(1)).strip()
-                # Collapse whitespace but preserve multilingual characters
-                title = re.sub(r"\s+", " ", extracted)
+        exit_code = client.api.exec_inspect(exec_id).get("ExitCode")
+        returncode = -1 if exit_code is None else exit_code
+        return returncode, head, b"".join(stderr_parts)
+
+    def _run_container(
+        self,
+        client: "docker.DockerClient",
+        singlefile_args: List[str],
+        volumes: Dict[str, Dict[str, str]],
+        destination: IO[bytes],
+        timeout: float,
+    ) -> Tuple[int, bytes, bytes]:
+        """Run a SingleFile container, streaming its stdout into ``destination``.
+
+        Returns the same ``(exit code, head, stderr)`` triple as
+        :meth:`_run_streaming`.
+        """
+        deadline = time.monotonic() + timeout
+
+        container = client.containers.run(
+            self.config.docker_image,
+            command=singlefile_args,
+            volumes=volumes,
+            detach=True,
+        )
+        # The log stream blocks until the container exits, so enforce the
+        # timeout by killing the container
+        timer = threading.Timer(timeout, self._kill_container, args=(container,))
+        timer.start()
+        try:
+            chunks = container.logs(stdout=True, stderr=False, stream=True, follow=True)
+            head = self._copy_stream(chunks, destination)
+            returncode = container.wait()["StatusCode"]
+            stderr = container.logs(stdout=False, stderr=True)
+        finally:
+            timer.cancel()
+            try:
+                container.remove(force=True)
+            except self._docker_errors as exc:
+                logger.debug("Failed to remove container %s: %s", container.id, exc)
+
+        if returncode != 0 and time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(singlefile_args, timeout)
+
+        return returncode, head, stderr
+
+    def _kill_container(self, container: "docker.models.containers.Container") -> None:
+        """Kill a container, ignoring errors if it already exited."""
+        try:
+            container.kill()
+        except self._docker_errors:
+            pass
+
+    def _run_streaming(
+        self, docker_cmd: List[str], destination: IO[bytes], timeout: float
+    ) -> Tuple[int, bytes, bytes]:
+        """Run a command, streaming its stdout into ``destination``.
+
+        Returns the exit code, the leading bytes of stdout (for title
+        detection) and the captured stderr.
+        """
+        deadline = time.monotonic() + timeout
+
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(docker_cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+            assert proc.stdout is not None
+            stdout = proc.stdout
+            # Reads block on the pipe, so enforce the timeout by killing the process
+            timer = threading.Timer(timeout, proc.kill)
+            timer.start()
+            try:
+                chunks = iter(lambda: stdout.read(_STREAM_CHUNK_BYTES), b"")
+                head = self._copy_stream(chunks, destination)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                stdout.close()
+
+            if returncode != 0 and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(docker_cmd, timeout)
+
+            stderr_file.seek(0)
+            return returncode, head, stderr_file.read()
+
+    @staticmethod
+    def _copy_stream(chunks: Iterable[bytes], destination: IO[bytes]) -> bytes:
+        """Write chunks to ``destination`` and return the head kept for title detection."""
+        head = bytearray()
+        for chunk in chunks:
+            if len(head) < _TITLE_SCAN_BYTES:
+                head += chunk[: _TITLE_SCAN_BYTES - len(head)]
+            destination.write(chunk)
+        return bytes(head)
+
+    def _store_archive(
+        self,
+        url: str,
+        tmp_path: Path,
+        head: bytes,
+        output_dir: Path,
+        existing: Optional[Set[str]] = None,
+    ) -> ArchiveResult:
+        """Move a streamed archive into place under its title-based name."""
+        if head:
+            output_file = self._derive_output_file(url, head, output_dir, existing)
+            try:
+                os.replace(tmp_path, output_file)
+                logger.info("Wrote archive content from stdout to %s", output_file)
+                return ArchiveResult(
+                    success=True,
+                    output_file=output_file,
+                    message=f"Archived via stdout to {output_file}"
+                )
+            except OSError as exc:
+                error_msg = f"Failed to save stdout content to {output_file}: {exc}"
+                logger.error(error_msg)
+                return ArchiveResult(success=False, error=error_msg)
+
+        output_file = self._derive_output_file(url, b"", output_dir)
+        if output_file.exists():
+            return ArchiveResult(
+                success=True,
+                output_file=output_file,
+                message=f"Successfully archived to {output_file}"
+            )
+
+        error_msg = f"Archive command succeeded but produced no output for {url}"
+        logger.error(error_msg)
+        return ArchiveResult(success=False, error=error_msg)
+
+    def _derive_output_file(
+        self,
+        url: str,
+        html_content: bytes,
+        output_dir: Path,
+        existing: Optional[Set[str]] = None,
+    ) -> Path:
+        """Generate a readable output filename based on page title.
+
+        ``existing`` holds the names already in ``output_dir``; when given it
+        replaces the per-call ``exists()`` check and records the chosen name.
+        """
+        title = _extract_title(html_content) if html_content else None
 
         if not title:
             parsed_url = urlparse(url)
@@ -204,13 +758,7 @@ class DockerService:
             title = fallback or "archived_page"
 
         # Encode URL for safe inclusion in filename (avoid / : ? * etc.)
-        def _encode_url_for_filename(raw: str, max_len: int = 180) -> str:
-            encoded = quote(raw, safe="")
-            if len(encoded) > max_len:
-                return encoded[: max_len - 1] + "…"
-            return encoded
-
-        url_part = _encode_url_for_filename(url)
+        url_part = encode_url_for_filename(url)
 
         # Fixed format: (<title>) [URL] <encoded_url>
         base = f"({title}) [URL] {url_part}"
@@ -219,13 +767,16 @@ class DockerService:
             sanitized += '.html'
 
         candidate = output_dir / sanitized
-        if candidate.exists():
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        taken = sanitized in existing if existing is not None else candidate.exists()
+        if taken:
+            timestamp = collision_suffix()
             sanitized = safe_filename(f"{base}_{timestamp}")
             if not sanitized.endswith('.html'):
                 sanitized += '.html'
             candidate = output_dir / sanitized
 
+        if existing is not None:
+            existing.add(sanitized)
         return candidate
     
     def test_connection(self) -> ArchiveResult:
@@ -1,12 +1,14 @@
 """File system monitoring service."""
 
+import errno
 import os
 import re
 import shutil
 import time
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import Iterator, List, Optional, Tuple
 
 # Try to import watchdog, use polling if not available
 try:
@@ -21,9 +23,68 @@ except ImportError:
         pass
 
 from ..utils.logging import get_logger
+from ..utils.paths import collision_suffix
 
 logger = get_logger(__name__)
 
+# Patterns for timestamp in filename - very flexible
+TIMESTAMP_PATTERNS = [
+    r'\(\d+[_\-/]\d+[_\-/]\d+\s+\d+[:\：\.]\d+[:\：\.]?\d*\s*[APM]*\)',  # (8_20_2025 1:18:55 PM) or (8_14_2025 8：58：47 PM)
+    r'\(\d{4}[_\-/]\d{1,2}[_\-/]\d{1,2}[_\s\-T]\d{1,2}[:\：\.]?\d{1,2}[:\：\.]?\d*\)',  # (2025-08-20 13:18:55)
+    r'\(\d{8}[_\-T]\d{6}\)',  # (20250820_131855)
+    r'\(\d{4}[_\-/]\d{1,2}[_\-/]\d{1,2}\)',  # (2025-08-20) - date only
+    r'\(\d+[_\-/]\d+[_\-/]\d+\)',  # (8_20_2025) - flexible date format
+]
+
+# Write-completion detection: a file is settled once two stats agree
+STABLE_POLL_INTERVAL = 0.05
+STABLE_TIMEOUT = 5.0
+
+# Upper bound on remembered processed files for long-running monitors
+SEEN_FILES_LIMIT = 100_000
+
+# Moves are blocking I/O, so a backlog is moved by a few threads at once
+MOVE_WORKERS = 8
+
+# All timestamp patterns combined into one alternation, compiled once
+TIMESTAMP_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in TIMESTAMP_PATTERNS),
+    re.IGNORECASE,
+)
+
+
+class SeenFiles:
+    """Bounded LRU set of files keyed on (device, inode, mtime)"""
+    
+    def __init__(self, limit: int = SEEN_FILES_LIMIT):
+        self.limit = limit
+        self._keys: "OrderedDict[Tuple[int, int, int], None]" = OrderedDict()
+    
+    @staticmethod
+    def key(file_path: Path) -> Optional[Tuple[int, int, int]]:
+        """Identify a file independent of its path; None if it is gone"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        # mtime guards against inode reuse after a copy+delete move
+        return (st.st_dev, st.st_ino, st.st_mtime_ns)
+    
+    def __contains__(self, key: Tuple[int, int, int]) -> bool:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        return False
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def add(self, key: Tuple[int, int, int]) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.limit:
+            self._keys.popitem(last=False)
+
 
 class HTMLFileHandler(FileSystemEventHandler):
     """Handler for file system events in the incoming directory"""
@@ -31,7 +92,7 @@ class HTMLFileHandler(FileSystemEventHandler):
     def __init__(self, monitor):
         super().__init__()
         self.monitor = monitor
-        self.processed_files: Set[str] = set()  # Track processed files to avoid duplicates
+        self.processed_files = SeenFiles()  # Track processed files to avoid duplicates
     
     def on_created(self, event):
         """Handle file creation events"""
@@ -45,16 +106,18 @@ class HTMLFileHandler(FileSystemEventHandler):
     
     def process_file(self, file_path: Path):
         """Process a single file if it matches our criteria"""
-        # Avoid processing the same file multiple times
-        if str(file_path) in self.processed_files:
+        # Ensure file is fully written
+        if not self.monitor.wait_until_stable(file_path):
             return
         
-        # Small delay to ensure file is fully written
-        time.sleep(0.5)
+        # Avoid processing the same file multiple times
+        key = SeenFiles.key(file_path)
+        if key is None or key in self.processed_files:
+            return
         
         if self.monitor.should_move_file(file_path):
             self.monitor.move_file_to_archive(file_path)
-            self.processed_files.add(str(file_path))
+            self.processed_files.add(key)
 
 
 class FileMonitor:
@@ -65,7 +128,7 @@ class FileMonitor:
         self.watch_dir = Path(watch_dir)
         self.archive_dir = Path(archive_dir)
         self.check_interval = check_interval
-        self.processed_files: Set[str] = set()
+        self.processed_files = SeenFiles()
         
         # Ensure directories exist
         self.watch_dir.mkdir(parents=True, exist_ok=True)
@@ -74,6 +137,33 @@ class FileMonitor:
         logger.info(f"📁 Incoming directory: {self.watch_dir}")
         logger.info(f"📁 Archive directory: {self.archive_dir}")
     
+    def _iter_html_files(self) -> Iterator[Path]:
+        """Yield the .html files directly inside the watch directory"""
+        with os.scandir(self.watch_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.html') and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+    
+    @staticmethod
+    def wait_until_stable(file_path: Path, timeout: float = STABLE_TIMEOUT) -> bool:
+        """Wait until a file's size and mtime stop changing; False if it vanished"""
+        deadline = time.monotonic() + timeout
+        try:
+            st = os.stat(file_path)
+            previous = (st.st_size, st.st_mtime_ns)
+            while time.monotonic() < deadline:
+                time.sleep(STABLE_POLL_INTERVAL)
+                st = os.stat(file_path)
+                current = (st.st_size, st.st_mtime_ns)
+                if current == previous:
+                    return True
+                previous = current
+        except FileNotFoundError:
+            return False
+        
+        logger.debug(f"File still changing after {timeout}s: {file_path.name}")
+        return True
+    
     def should_move_file(self, file_path: Path) -> bool:
         """Check if file matches our naming pattern criteria"""
         if not file_path.exists():
@@ -89,19 +179,10 @@ class FileMonitor:
             logger.info(f"✅ File matches special pattern (contains 'X 上的'): {filename}")
             return True
         
-        # Pattern for timestamp in filename - very flexible
-        timestamp_patterns = [
-            r'\(\d+[_\-/]\d+[_\-/]\d+\s+\d+[:\：\.]\d+[:\：\.]?\d*\s*[APM]*\)',  # (8_20_2025 1:18:55 PM) or (8_14_2025 8：58：47 PM)
-            r'\(\d{4}[_\-/]\d{1,2}[_\-/]\d{1,2}[_\s\-T]\d{1,2}[:\：\.]?\d{1,2}[:\：\.]?\d*\)',  # (2025-08-20 13:18:55)
-            r'\(\d{8}[_\-T]\d{6}\)',  # (20250820_131855)
-            r'\(\d{4}[_\-/]\d{1,2}[_\-/]\d{1,2}\)',  # (2025-08-20) - date only
-            r'\(\d+[_\-/]\d+[_\-/]\d+\)',  # (8_20_2025) - flexible date format
-        ]
-        
-        for pattern in timestamp_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
-                logger.info(f"✅ File matches timestamp pattern: {filename}")
-                return True
+        # Every timestamp pattern starts with "(", so skip the regex without one
+        if "(" in filename and TIMESTAMP_RE.search(filename):
+            logger.info(f"✅ File matches timestamp pattern: {filename}")
+            return True
         
         logger.debug(f"❌ File does not match any patterns: {filename}")
         return False
@@ -117,22 +198,21 @@ class FileMonitor:
             # Handle filename conflicts
             if destination.exists():
                 # Add timestamp suffix to avoid conflicts
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                timestamp = collision_suffix()
                 stem = destination.stem
                 suffix = destination.suffix
                 destination = self.archive_dir / f"{stem}_moved_{timestamp}{suffix}"
             
-            # Move the file
-            shutil.move(str(file_path), str(destination))
+            # Move the file: a single rename on the same filesystem,
+            # copy + delete only when the archive lives on another device
+            try:
+                os.replace(file_path, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(str(file_path), str(destination))
             logger.info(f"📁 Moved: {file_path.name} → {destination}")
-            
-            # Verify the move was successful
-            if destination.exists() and not file_path.exists():
-                logger.info(f"✅ Successfully moved to archive: {destination.name}")
-                return True
-            else:
-                logger.error(f"❌ Move verification failed for: {file_path.name}")
-                return False
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Error moving file {file_path.name}: {e}")
@@ -146,14 +226,7 @@ class FileMonitor:
             logger.warning(f"Incoming directory does not exist: {self.watch_dir}")
             return 0
         
-        moved_count = 0
-        
-        for file_path in self.watch_dir.glob("*.html"):
-            if str(file_path) not in self.processed_files:
-                if self.should_move_file(file_path):
-                    if self.move_file_to_archive(file_path):
-                        moved_count += 1
-                        self.processed_files.add(str(file_path))
+        moved_count = self._move_files(self.find_matching_files())
         
         if moved_count > 0:
             logger.info(f"📦 Initial scan complete: {moved_count} files moved")
@@ -162,6 +235,42 @@ class FileMonitor:
         
         return moved_count
     
+    def find_matching_files(self) -> List[Path]:
+        """List the files in the watch directory that should be archived"""
+        # Classify all names up front instead of logging a verdict per file
+        candidates = list(self._iter_html_files())
+        special = [p for p in candidates if "X 上的" in p.name]
+        timestamped = [
+            p for p in candidates
+            if "X 上的" not in p.name and "(" in p.name and TIMESTAMP_RE.search(p.name)
+        ]
+        logger.info(
+            f"🔍 {len(candidates)} HTML files: {len(special)} special, "
+            f"{len(timestamped)} timestamped"
+        )
+        for file_path in special + timestamped:
+            logger.debug(f"✅ File matches pattern: {file_path.name}")
+        return special + timestamped
+    
+    def _move_files(self, files: List[Path]) -> int:
+        """Move not-yet-processed files to the archive concurrently"""
+        pending = []
+        for file_path in files:
+            key = SeenFiles.key(file_path)
+            if key is not None and key not in self.processed_files:
+                pending.append((file_path, key))
+        if not pending:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(pending))) as pool:
+            results = list(pool.map(self.move_file_to_archive, [f for f, _ in pending]))
+        
+        # Record results from this thread so processed_files needs no lock
+        for (_, key), moved in zip(pending, results):
+            if moved:
+                self.processed_files.add(key)
+        return sum(results)
+    
     def start_monitoring(self, use_watchdog: bool = True) -> None:
         """Start file system monitoring"""
         logger.info("🚀 Starting File Monitor")
@@ -209,11 +318,12 @@ class FileMonitor:
             while True:
                 # Check for new files
                 if self.watch_dir.exists():
-                    for file_path in self.watch_dir.glob("*.html"):
-                        if str(file_path) not in self.processed_files:
+                    for file_path in self._iter_html_files():
+                        key = SeenFiles.key(file_path)
+                        if key is not None and key not in self.processed_files:
                             if self.should_move_file(file_path):
                                 if self.move_file_to_archive(file_path):
-                                    self.processed_files.add(str(file_path))
+                                    self.processed_files.add(key)
                 
                 time.sleep(self.check_interval)
                 
@@ -226,10 +336,7 @@ class FileMonitor:
         if not files:
             return 0
         
-        moved_count = 0
-        for file_path in files:
-            if self.move_file_to_archive(file_path):
-                moved_count += 1
+        moved_count = self._move_files(files)
         
         if moved_count > 0:
             logger.info(f"Processed {moved_count} files")
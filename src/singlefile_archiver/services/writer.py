@@ -1,75 +1,205 @@
 """Atomic key-value writing service."""
 
+import copy
 import json
+import os
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ..utils import serialization
 from ..utils.paths import get_project_dir
 
+# State is a JSON-lines log of {"op", "key", "value"} records
+STATE_FILE_NAME = "state.jsonl"
+
+# Earlier releases kept the state as a single JSON object in state.json
+_LEGACY_STATE_FILE_NAME = "state.json"
+
 
 class StateWriter:
     """Atomic writer for application state."""
     
-    def __init__(self, state_file: Optional[Path] = None):
+    def __init__(self, state_file: Optional[Path] = None, compact_threshold: int = 1000):
         """Initialize the state writer."""
         if state_file is None:
             project_dir = get_project_dir()
-            state_file = project_dir / "state.json"
+            state_file = project_dir / STATE_FILE_NAME
+            legacy_file = project_dir / _LEGACY_STATE_FILE_NAME
+            if legacy_file.exists() and not state_file.exists():
+                # Picked up as a snapshot and converted on the first write
+                legacy_file.replace(state_file)
         
         self.state_file = state_file
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Writes append to a JSON-lines log; compaction rewrites it atomically
+        self.compact_threshold = compact_threshold
+        self._log_records = 0
+        self._checked_format = False
+        
+        # Replayed state, kept in memory and updated in place on writes
+        self._cache: Optional[Dict[str, Any]] = None
+        self._lock = threading.RLock()
     
     def _read_state(self) -> Dict[str, Any]:
-        """Read the current state from file."""
+        """Return the cached state, loading it from disk on first use."""
+        with self._lock:
+            if self._cache is None:
+                self._cache = self._load_state()
+            return self._cache
+    
+    def reload(self) -> None:
+        """Drop the cached state so the next access re-reads the file."""
+        with self._lock:
+            self._cache = None
+            self._checked_format = False
+    
+    def _load_state(self) -> Dict[str, Any]:
+        """Replay the state log into a dict."""
         if not self.state_file.exists():
             return {}
         
+        state: Dict[str, Any] = {}
+        records = 0
+        offset = 0
+        torn_at: Optional[int] = None
         try:
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
+            with open(self.state_file, 'rb') as f:
+                first_line = f.readline().strip()
+                if first_line and not first_line.startswith(b'{"op"'):
+                    # Not a log: a state file written as a single JSON object
+                    return self._read_snapshot()
+                f.seek(0)
+                
+                for line in f:
+                    line_start = offset
+                    offset += len(line)
+                    if not line.endswith(b"\n"):
+                        # Every append ends in a newline, so this one was cut short
+                        torn_at = line_start
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        record = serialization.loads(line)
+                        key = record["key"]
+                    except (ValueError, KeyError, TypeError):
+                        # Skip a damaged record rather than dropping the whole log
+                        continue
+                    if record.get("op") == "del":
+                        state.pop(key, None)
+                    else:
+                        state[key] = record.get("value")
+                    records += 1
+            
+            if torn_at is not None:
+                # Drop the partial record so the next append starts on a fresh line
+                with open(self.state_file, 'r+b') as f:
+                    f.truncate(torn_at)
+        except IOError:
+            return {}
+        
+        self._log_records = records
+        return state
+    
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """Read a state file stored as one JSON object."""
+        try:
+            with open(self.state_file, 'rb') as f:
+                state = serialization.loads(f.read())
         except (json.JSONDecodeError, IOError):
             return {}
+        return state if isinstance(state, dict) else {}
+    
+    def _append(self, record: Dict[str, Any]) -> bytes:
+        """Append a single record to the state log and return the encoded line."""
+        line = serialization.dumps(record) + b"\n"
+        with open(self.state_file, 'ab') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self._log_records += 1
+        return line
     
     def _write_state(self, state: Dict[str, Any]) -> None:
-        """Atomically write state to file."""
+        """Atomically replace the state log with one record per key."""
         # Write to temporary file first
         with tempfile.NamedTemporaryFile(
-            mode='w',
+            mode='wb',
             suffix='.json',
             dir=self.state_file.parent,
             delete=False
         ) as tmp_file:
-            json.dump(state, tmp_file, indent=2)
+            tmp_file.write(b"".join(
+                serialization.dumps({"op": "set", "key": key, "value": value}) + b"\n"
+                for key, value in state.items()
+            ))
             tmp_path = Path(tmp_file.name)
         
         # Atomic move to final location
         tmp_path.replace(self.state_file)
+        self._log_records = len(state)
+        self._cache = dict(state)
+    
+    def compact(self) -> None:
+        """Rewrite the state log so it holds only the live keys."""
+        with self._lock:
+            self._write_state(self._read_state())
+    
+    def _maybe_compact(self) -> None:
+        """Compact once superseded records dominate the log."""
+        state = self._read_state()
+        if self._log_records > max(self.compact_threshold, 2 * len(state)):
+            self._write_state(state)
+    
+    def _ensure_log(self) -> None:
+        """Convert a single-object state file to the log format before appending."""
+        if self._checked_format:
+            return
+        self._checked_format = True
+        if not self.state_file.exists():
+            return
+        with open(self.state_file, 'rb') as f:
+            first_line = f.readline().strip()
+        if first_line and not first_line.startswith(b'{"op"'):
+            self._write_state(self._read_snapshot())
+        else:
+            self._read_state()
     
     def write(self, key: str, value: Any) -> None:
         """Write a key-value pair to the state file."""
-        state = self._read_state()
-        state[key] = value
-        self._write_state(state)
+        with self._lock:
+            self._ensure_log()
+            line = self._append({"op": "set", "key": key, "value": value})
+            # Cache the value as a reload would see it, detached from the caller's object
+            self._read_state()[key] = serialization.loads(line)["value"]
+            self._maybe_compact()
     
     def read(self, key: str, default: Any = None) -> Any:
         """Read a value from the state file."""
         state = self._read_state()
-        return state.get(key, default)
+        return copy.deepcopy(state.get(key, default))
     
     def delete(self, key: str) -> bool:
         """Delete a key from the state file."""
-        state = self._read_state()
-        if key in state:
-            del state[key]
-            self._write_state(state)
-            return True
-        return False
+        with self._lock:
+            state = self._read_state()
+            if key in state:
+                self._ensure_log()
+                self._append({"op": "del", "key": key})
+                state.pop(key, None)
+                self._maybe_compact()
+                return True
+            return False
     
     def clear(self) -> None:
         """Clear all state."""
-        self._write_state({})
+        with self._lock:
+            self._write_state({})
     
     def get_all(self) -> Dict[str, Any]:
         """Get all state data."""
-        return self._read_state()
\ No newline at end of file
+        return copy.deepcopy(self._read_state())
\ No newline at end of file
@@ -2,72 +2,22 @@
 
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from .paths import get_project_dir
 
-
-def _get_default_data_dir() -> str:
-    """Get default data directory from environment or fallback to user directory."""
-    return os.getenv(
-        "SINGLEFILE_DATA_DIR", 
-        str(Path.home() / ".local" / "share" / "singlefile")
-    )
-
-
-def _get_default_archive_dir() -> str:
-    """Get default archive directory from environment or fallback to data subdirectory."""
-    return os.getenv(
-        "SINGLEFILE_ARCHIVE_DIR",
-        str(Path(_get_default_data_dir()) / "archive")
-    )
+if TYPE_CHECKING:
+    from .config_model import Config
 
 
-def _get_default_incoming_dir() -> str:
-    """Get default incoming directory from environment or fallback to data subdirectory."""
-    return os.getenv(
-        "SINGLEFILE_INCOMING_DIR",
-        str(Path(_get_default_data_dir()) / "incoming")
-    )
-
-
-class Config(BaseModel):
-    """Application configuration model."""
-    
-    # Project paths
-    project_dir: str = Field(default_factory=lambda: str(get_project_dir()))
-    
-    # Archive settings
-    archive_output_dir: str = Field(default_factory=_get_default_archive_dir)
-    archive_batch_size: int = Field(default=10)
-    max_retries: int = Field(default=10)
-    retry_delay: int = Field(default=2)
-    
-    # Monitor settings
-    monitor_watch_dir: str = Field(default_factory=_get_default_incoming_dir)
-    monitor_archive_dir: str = Field(default_factory=_get_default_archive_dir)
-    monitor_pattern: str = Field(default="*.html")
-    monitor_interval: int = Field(default=2)
-    
-    # Docker settings
-    docker_image: str = Field(default="capsulecode/singlefile")
-    docker_container: str = Field(default="singlefile-cli")
-    docker_output_dir: str = Field(default="/data/archive")
-    docker_timeout: int = Field(default=300)
-    docker_cookies_file: Optional[str] = Field(default=None)
-    docker_cookies_mount_path: str = Field(default="/tmp/singlefile-cookies.json")
-    
-    # Retry settings
-    max_retry_attempts: int = Field(default=10)
-    retry_delay: int = Field(default=2)
-    
-    # Logging
-    log_level: str = Field(default="INFO")
-    log_to_file: bool = Field(default=True)
-    log_to_console: bool = Field(default=True)
+def __getattr__(name: str) -> Any:
+    """Expose ``Config`` without importing pydantic at module load."""
+    if name == "Config":
+        from .config_model import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _parse_env_line(line: str) -> Optional[Tuple[str, str]]:
@@ -90,20 +40,20 @@ def _parse_env_line(line: str) -> Optional[Tuple[str, str]]:
 
 def _load_env_fallback(env_path: Path) -> None:
     try:
-        lines = env_path.read_text(encoding="utf-8").splitlines()
+        with open(env_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parsed = _parse_env_line(line)
+                if not parsed:
+                    continue
+                key, value = parsed
+                if key in os.environ:
+                    continue
+                os.environ[key] = value
     except OSError:
         return
-    for line in lines:
-        parsed = _parse_env_line(line)
-        if not parsed:
-            continue
-        key, value = parsed
-        if key in os.environ:
-            continue
-        os.environ[key] = value
 
 
-def _apply_env_overrides(config: Config) -> Config:
+def _apply_env_overrides(config: "Config") -> "Config":
     """Update config paths from environment variables when provided."""
     data_dir = os.getenv("SINGLEFILE_DATA_DIR")
     if data_dir:
@@ -122,28 +72,59 @@ def _apply_env_overrides(config: Config) -> Config:
     return config
 
 
-def load_config(config_file: Optional[Path] = None) -> Config:
-    """Load configuration from file or create default."""
-    project_dir = get_project_dir()
-    project_root = project_dir.parent
+# Set once the .env file has been applied to os.environ
+_ENV_LOADED = False
+
+# Loaded configurations keyed by absolute config.json path
+_CONFIG_CACHE: Dict[Path, "Config"] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
 
-    # Load environment variables from .env file if it exists
-    env_file = project_root / ".env"
-    if env_file.exists():
-        try:
-            from dotenv import load_dotenv
-            load_dotenv(env_file)
-        except ImportError:
-            _load_env_fallback(env_file)
 
+def _resolve_config_file(config_file: Optional[Path]) -> Path:
+    """Return the absolute path of the config file to use."""
     if config_file is None:
-        config_file = project_dir / "config.json"
+        config_file = get_project_dir() / "config.json"
+    return Path(os.path.abspath(config_file))
+
+
+def invalidate_config_cache() -> None:
+    """Forget loaded configurations so the next access re-reads config.json."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
+def load_config(config_file: Optional[Path] = None) -> "Config":
+    """Load configuration from file or create default (cached per file)."""
+    config_file = _resolve_config_file(config_file)
+    cached = _CONFIG_CACHE.get(config_file)
+    if cached is not None:
+        return cached
+
+    from .config_model import Config
+
+    project_dir = get_project_dir()
+    project_root = project_dir.parent
+
+    # Load environment variables from .env file if it exists (once per process)
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        _ENV_LOADED = True
+        env_file = project_root / ".env"
+        if os.path.isfile(env_file):
+            try:
+                from dotenv import load_dotenv
+                load_dotenv(env_file)
+            except ImportError:
+                _load_env_fallback(env_file)
 
     if config_file.exists():
         try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-            return _apply_env_overrides(Config(**config_data))
+            # Parse and validate in one pass inside pydantic-core
+            with open(config_file, 'rb') as f:
+                config = _apply_env_overrides(Config.model_validate_json(f.read()))
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[config_file] = config
+            return config
         except (json.JSONDecodeError, Exception):
             # If config is corrupted, create a new one
             pass
@@ -154,25 +135,29 @@ def load_config(config_file: Optional[Path] = None) -> Config:
     return config
 
 
-def save_config(config: Config, config_file: Optional[Path] = None) -> None:
+def save_config(config: "Config", config_file: Optional[Path] = None) -> None:
     """Save configuration to file."""
-    if config_file is None:
-        project_dir = get_project_dir()
-        config_file = project_dir / "config.json"
+    config_file = _resolve_config_file(config_file)
     
     # Ensure parent directory exists
     config_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(config_file, 'w') as f:
-        json.dump(config.model_dump(), f, indent=2)
+    # Keep config.json indented: it is meant to be edited by hand.
+    # pydantic-core serializes as fast as orjson, with or without orjson.
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write(config.model_dump_json(indent=2))
+    
+    # What was just written is what the next load would return
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[config_file] = config
 
 
-def get_config() -> Config:
-    """Get the current configuration."""
+def get_config() -> "Config":
+    """Get the current configuration (loaded from disk once per process)."""
     return load_config()
 
 
-def update_config(updates: Dict[str, Any]) -> Config:
+def update_config(updates: Dict[str, Any]) -> "Config":
     """Update configuration with new values."""
     config = get_config()
     
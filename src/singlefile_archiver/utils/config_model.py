@@ -0,0 +1,87 @@
+"""Application configuration model, imported lazily so pydantic loads on demand."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from .paths import get_project_dir
+
+
+# Defaults are resolved once per process (after .env has been applied by
+# load_config), not once per Config() construction
+@lru_cache(maxsize=1)
+def _get_default_project_dir() -> str:
+    """Get default project directory as a string."""
+    return str(get_project_dir())
+
+
+@lru_cache(maxsize=1)
+def _get_default_data_dir() -> str:
+    """Get default data directory from environment or fallback to user directory."""
+    return os.getenv(
+        "SINGLEFILE_DATA_DIR", 
+        str(Path.home() / ".local" / "share" / "singlefile")
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_default_archive_dir() -> str:
+    """Get default archive directory from environment or fallback to data subdirectory."""
+    return os.getenv(
+        "SINGLEFILE_ARCHIVE_DIR",
+        str(Path(_get_default_data_dir()) / "archive")
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_default_incoming_dir() -> str:
+    """Get default incoming directory from environment or fallback to data subdirectory."""
+    return os.getenv(
+        "SINGLEFILE_INCOMING_DIR",
+        str(Path(_get_default_data_dir()) / "incoming")
+    )
+
+
+class Config(BaseModel):
+    """Application configuration model."""
+    
+    # Project paths
+    project_dir: str = Field(default_factory=_get_default_project_dir)
+    
+    # Archive settings
+    archive_output_dir: str = Field(default_factory=_get_default_archive_dir)
+    archive_batch_size: int = Field(default=10)
+    max_retries: int = Field(default=10)
+    retry_delay: int = Field(default=2)
+    
+    # Monitor settings
+    monitor_watch_dir: str = Field(default_factory=_get_default_incoming_dir)
+    monitor_archive_dir: str = Field(default_factory=_get_default_archive_dir)
+    monitor_pattern: str = Field(default="*.html")
+    monitor_interval: int = Field(default=2)
+    
+    # Docker settings
+    docker_image: str = Field(default="capsulecode/singlefile")
+    docker_container: str = Field(default="singlefile-cli")
+    docker_output_dir: str = Field(default="/data/archive")
+    docker_timeout: int = Field(default=300)
+    docker_persistent: bool = Field(default=False)
+    docker_cookies_file: Optional[str] = Field(default=None)
+    docker_cookies_mount_path: str = Field(default="/tmp/singlefile-cookies.json")
+    
+    # Logging
+    log_level: str = Field(default="INFO")
+    log_to_file: bool = Field(default=True)
+    log_to_console: bool = Field(default=True)
+    
+    @property
+    def max_retry_attempts(self) -> int:
+        """Alias of ``max_retries`` kept for backwards compatibility."""
+        return self.max_retries
+    
+    @max_retry_attempts.setter
+    def max_retry_attempts(self, value: int) -> None:
+        self.max_retries = value
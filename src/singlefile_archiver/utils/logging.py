@@ -1,12 +1,78 @@
 """Logging configuration and utilities."""
 
 import logging
+import logging.handlers
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
 from .paths import get_project_dir
 
+# Buffered file records are written out at least this often (seconds)
+FILE_FLUSH_INTERVAL = 1.0
+
+# One buffered file handler shared by every module logger, so records
+# reach the log file in the order they were emitted
+_FILE_HANDLER: Optional[logging.Handler] = None
+_FILE_HANDLER_LOCK = threading.Lock()
+
+
+class _PeriodicMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes on a timer so quiet processes keep writing."""
+    
+    def __init__(
+        self,
+        capacity: int,
+        flushLevel: int,
+        target: logging.Handler,
+        flushOnClose: bool,
+        interval: float,
+    ) -> None:
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=flushOnClose)
+        self._stopped = threading.Event()
+        flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(interval,),
+            name="log-flush",
+            daemon=True,
+        )
+        flusher.start()
+    
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self.flush()
+    
+    def close(self) -> None:
+        self._stopped.set()
+        super().close()
+
+
+def _get_file_handler(formatter: logging.Formatter) -> logging.Handler:
+    """Return the process-wide buffered handler for the log file."""
+    global _FILE_HANDLER
+    with _FILE_HANDLER_LOCK:
+        if _FILE_HANDLER is None:
+            project_dir = get_project_dir()
+            log_file = project_dir / "logs" / "singlefile_archiver.log"
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(formatter)
+            
+            # Batch records in memory; a full buffer, errors, the flush timer
+            # and interpreter shutdown write them out
+            _FILE_HANDLER = _PeriodicMemoryHandler(
+                capacity=1024,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True,
+                interval=FILE_FLUSH_INTERVAL,
+            )
+            _FILE_HANDLER.setLevel(logging.DEBUG)
+        return _FILE_HANDLER
+
 
 def setup_logging(
     name: Optional[str] = None,
@@ -38,14 +104,7 @@ def setup_logging(
     
     # File handler
     if log_to_file:
-        project_dir = get_project_dir()
-        log_file = project_dir / "logs" / "singlefile_archiver.log"
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_get_file_handler(formatter))
     
     return logger
 
@@ -1,32 +1,54 @@
 """Path utilities and project directory management."""
 
+import hashlib
+import itertools
+import os
 import re
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
+# Compiled once; slugify/safe_filename run for every archived page
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEP_RE = re.compile(r'[\s_-]+')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Byte -> text table matching urllib.parse.quote(..., safe=""): unreserved
+# characters pass through, everything else becomes %XX
+_URL_QUOTE_TABLE = [f"%{byte:02X}" for byte in range(256)]
+for _byte in b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~":
+    _URL_QUOTE_TABLE[_byte] = chr(_byte)
+del _byte
+
 
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
     # Convert to lowercase and replace spaces/special chars with hyphens
-    slug = re.sub(r'[^\w\s-]', '', text.lower())
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    slug = _SLUG_STRIP_RE.sub('', text.lower())
+    slug = _SLUG_SEP_RE.sub('-', slug)
     return slug.strip('-')
 
 
+@lru_cache(maxsize=None)
 def get_project_dir(project_name: str = "singlefile-archiver") -> Path:
-    """Get the project data directory using the current project root."""
+    """Get the project data directory using the current project root (resolved once)."""
     # Find the project root by looking for pyproject.toml
-    current_dir = Path(__file__).parent
-    while current_dir != current_dir.parent:
-        if (current_dir / "pyproject.toml").exists():
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    current_dir = package_dir
+    while True:
+        if os.path.isfile(os.path.join(current_dir, "pyproject.toml")):
+            break
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            # Fallback to current file's directory structure
+            current_dir = os.path.dirname(os.path.dirname(os.path.dirname(package_dir)))
             break
-        current_dir = current_dir.parent
-    else:
-        # Fallback to current file's directory structure
-        current_dir = Path(__file__).parent.parent.parent.parent
+        current_dir = parent_dir
     
     # Create data directory in project root
-    project_dir = current_dir / "data"
+    project_dir = Path(current_dir) / "data"
     project_dir.mkdir(parents=True, exist_ok=True)
     
     return project_dir
@@ -35,10 +57,13 @@ def get_project_dir(project_name: str = "singlefile-archiver") -> Path:
 def ensure_directory(path: Union[str, Path]) -> Path:
     """Ensure a directory exists, creating it if necessary."""
     path_obj = Path(path)
-    path_obj.mkdir(parents=True, exist_ok=True)
+    # Skip the mkdir syscall chain when the directory is already there
+    if not os.path.isdir(path_obj):
+        path_obj.mkdir(parents=True, exist_ok=True)
     return path_obj
 
 
+@lru_cache(maxsize=None)
 def get_archive_base_dir() -> Path:
     """Get the base directory for archived files."""
     project_dir = get_project_dir()
@@ -46,6 +71,7 @@ def get_archive_base_dir() -> Path:
     return ensure_directory(archive_dir)
 
 
+@lru_cache(maxsize=None)
 def get_temp_dir() -> Path:
     """Get a temporary directory for processing."""
     project_dir = get_project_dir()
@@ -56,12 +82,32 @@ def get_temp_dir() -> Path:
 def safe_filename(filename: str, max_length: int = 255) -> str:
     """Convert a string to a safe filename."""
     # Remove/replace unsafe characters
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    safe_name = re.sub(r'\s+', '_', safe_name)
+    safe_name = _UNSAFE_FILENAME_RE.sub('_', filename)
+    safe_name = _WHITESPACE_RE.sub('_', safe_name)
     
     # Limit length
     if len(safe_name) > max_length:
         name_part = safe_name[:max_length-10]
-        safe_name = f"{name_part}_{hash(filename) % 10000}"
+        # Stable across runs (unlike hash()), so a title maps to one name
+        digest = hashlib.blake2b(filename.encode('utf-8'), digest_size=3).hexdigest()
+        safe_name = f"{name_part}_{digest}"
     
-    return safe_name
\ No newline at end of file
+    return safe_name
+
+
+# Makes collision suffixes unique even within the same second
+_COLLISION_COUNTER = itertools.count(1)
+
+
+def collision_suffix() -> str:
+    """Return a timestamp-and-counter suffix for a file name that is already taken."""
+    return f"{time.strftime('%Y%m%d_%H%M%S')}_{next(_COLLISION_COUNTER)}"
+
+
+def encode_url_for_filename(url: str, max_len: int = 180) -> str:
+    """Percent-encode a URL so it can be embedded in a filename."""
+    table = _URL_QUOTE_TABLE
+    encoded = "".join([table[byte] for byte in url.encode("utf-8")])
+    if len(encoded) > max_len:
+        return encoded[: max_len - 1] + "…"
+    return encoded
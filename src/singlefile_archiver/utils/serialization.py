@@ -0,0 +1,35 @@
+"""JSON encoding helpers backed by orjson when it is installed."""
+
+import json
+from typing import Any, Union, cast
+
+# Try to import orjson, use the stdlib json module if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to compact (or 2-space indented) JSON bytes."""
+    if ORJSON_AVAILABLE:
+        # Non-str dict keys are stringified the way the json module does it
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return cast(bytes, orjson.dumps(obj, option=option))
+        except orjson.JSONEncodeError:
+            # Values orjson rejects but json accepts (e.g. ints over 64 bits)
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)